@@ -9,12 +9,190 @@ import sys
 import os
 import subprocess
 import argparse
+import functools
+import json
+import queue
+import shutil
+import tempfile
+import threading
+import uuid
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import Optional
 import re
 import platform
 
 
+# Flags shared by every ffmpeg invocation: skip the multi-KB banner, silence
+# everything but real errors, and never touch the controlling terminal
+FFMPEG_BASE = ["-hide_banner", "-loglevel", "error", "-nostdin"]
+
+# Matches frame counter lines in FFmpeg's -progress output
+FFMPEG_PROGRESS_RE = re.compile(rb"frame=\s*(\d+)")
+
+# Keep roughly the last 64 KB of stderr for error reporting
+STDERR_TAIL_LINES = 512
+
+# How many inputs to feed a single ffmpeg in --batch-ffmpeg mode; bounds the
+# demuxer memory held open at once
+BATCH_CHUNK_SIZE = 32
+
+# Videos shorter than this (seconds) aren't worth splitting into segments
+MIN_SEGMENT_DURATION = 60.0
+
+# Recognized video file extensions, without the leading dot
+VIDEO_EXTENSIONS = frozenset(
+    {
+        "mp4",
+        "mov",
+        "avi",
+        "mkv",
+        "webm",
+        "flv",
+        "wmv",
+        "m4v",
+        "mpg",
+        "mpeg",
+        "3gp",
+        "m2ts",
+        "mts",
+        "ts",
+        "vob",
+        "f4v",
+        "asf",
+        "rm",
+        "rmvb",
+        "ogv",
+        "mxf",
+        "gif",
+    }
+)
+
+
+@functools.lru_cache(maxsize=16)
+def _normalize_format(format: str) -> str:
+    """Normalize an image format name (lowercase, no leading dot)."""
+    return format.lower().lstrip(".")
+
+
+def _parse_fps(fps_str: str) -> float:
+    """
+    Parse an ffprobe frame rate like "30/1", "30000/1001" or "29.97".
+
+    Plain arithmetic instead of eval(): far cheaper, and safe against
+    whatever ends up in the stream metadata.
+    """
+    num, _, den = fps_str.partition("/")
+    if den:
+        return float(num) / float(den) if float(den) else 0.0
+    return float(num)
+
+
+def _start_probe(ffprobe_bin: str, video_path: Path) -> subprocess.Popen:
+    """Launch the ffprobe metadata query without waiting for it."""
+    return subprocess.Popen(
+        [
+            ffprobe_bin,
+            "-hide_banner",
+            "-v",
+            "error",
+            "-select_streams",
+            "v:0",
+            "-show_entries",
+            "stream=duration,r_frame_rate,width,height",
+            "-print_format",
+            "json",
+            str(video_path),
+        ],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL,
+        text=True,
+    )
+
+
+def _finish_probe(probe: subprocess.Popen) -> dict:
+    """Collect a probe started by _start_probe and parse its metadata."""
+    try:
+        stdout, _ = probe.communicate()
+        if probe.returncode != 0:
+            raise ValueError("ffprobe failed")
+
+        streams = json.loads(stdout).get("streams", [])
+        if streams:
+            stream = streams[0]
+            fps = _parse_fps(stream.get("r_frame_rate", "0"))
+
+            return {
+                "duration": float(stream.get("duration", 0) or 0),
+                "fps": fps,
+                "width": int(stream.get("width", 0) or 0),
+                "height": int(stream.get("height", 0) or 0),
+            }
+    except (ValueError, KeyError, json.JSONDecodeError):
+        print("Warning: Could not retrieve video information")
+
+    return {"duration": 0, "fps": 0, "width": 0, "height": 0}
+
+
+def _probe_video_info(ffprobe_bin: str, video_path: Path) -> dict:
+    """Probe a video with ffprobe and return duration, fps and resolution."""
+    try:
+        return _finish_probe(_start_probe(ffprobe_bin, video_path))
+    except FileNotFoundError:
+        print("Warning: Could not retrieve video information")
+        return {"duration": 0, "fps": 0, "width": 0, "height": 0}
+
+
+@functools.lru_cache(maxsize=1)
+def _resolve_binaries() -> tuple:
+    """
+    Resolve the ffmpeg/ffprobe binary paths for this platform, once per
+    process.
+
+    Prefers the bundled binaries (with the right suffix for the OS, so the
+    local folder works on Linux/macOS too, not just Windows), then falls back
+    to whatever is on PATH.
+
+    Returns:
+        Tuple of (ffmpeg path, ffprobe path)
+    """
+    ffmpeg_dir = Path(__file__).parent / "ffmpeg" / "bin"
+    suffix = ".exe" if platform.system() == "Windows" else ""
+    ffmpeg = ffmpeg_dir / f"ffmpeg{suffix}"
+    ffprobe = ffmpeg_dir / f"ffprobe{suffix}"
+    return (
+        str(ffmpeg) if ffmpeg.is_file() else shutil.which("ffmpeg") or "ffmpeg",
+        str(ffprobe) if ffprobe.is_file() else shutil.which("ffprobe") or "ffprobe",
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _ensure_ffmpeg(ffmpeg_bin: str) -> None:
+    """
+    Check that the given FFmpeg binary runs, once per binary per process.
+
+    Cached so folder mode doesn't spawn an `ffmpeg -version` probe for every
+    video it processes.
+
+    Raises:
+        RuntimeError: If FFmpeg is missing or the version check fails
+    """
+    try:
+        subprocess.run(
+            [ffmpeg_bin, "-hide_banner", "-version"],
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            check=True,
+        )
+    except FileNotFoundError:
+        raise RuntimeError(
+            "FFmpeg is not installed or not in PATH. Please install FFmpeg or ensure ffmpeg folder exists."
+        )
+    except subprocess.CalledProcessError:
+        raise RuntimeError("FFmpeg check failed.")
+
+
 class VideoFrameExtractor:
     """Extract frames from video files using FFmpeg."""
 
@@ -24,6 +202,10 @@ class VideoFrameExtractor:
         output_dir: str,
         frame_rate: Optional[str] = None,
         format: str = "png",
+        ffmpeg_threads: Optional[int] = None,
+        video_info: Optional[dict] = None,
+        hwaccel: Optional[str] = None,
+        stage_dir: Optional[str] = None,
     ):
         """
         Initialize the video frame extractor.
@@ -33,14 +215,25 @@ class VideoFrameExtractor:
             output_dir: Directory to save extracted frames (supports relative or absolute paths)
             frame_rate: Optional FPS rate (e.g., '1' for 1 frame per second, '30' for all frames at 30fps)
             format: Output image format (png, jpg, bmp, webp, etc. - default: png)
+            ffmpeg_threads: Optional thread count passed to FFmpeg (use 1 when
+                running several extractions in parallel to avoid oversubscription)
+            video_info: Pre-probed metadata dict (duration, fps, width, height);
+                when given, the per-video ffprobe call is skipped
+            hwaccel: Optional hardware decode acceleration passed to FFmpeg
+                (e.g. 'cuda' on NVIDIA GPUs)
+            stage_dir: Optional staging directory for frame writes; frames
+                land there first and are bulk-moved to output_dir afterwards.
+                Pass 'auto' to use /dev/shm (or the system temp dir)
         """
         # Convert to absolute paths for clarity
         self.video_path = Path(video_path).expanduser().resolve()
         self.output_dir = Path(output_dir).expanduser().resolve()
         self.frame_rate = frame_rate or "30"  # Default to 30fps
-        self.format = format.lower().lstrip(
-            "."
-        )  # Normalize format (remove leading dot, lowercase)
+        self.format = _normalize_format(format)
+        self.ffmpeg_threads = ffmpeg_threads
+        self.video_info = video_info
+        self.hwaccel = hwaccel
+        self.stage_dir = stage_dir
 
         # Setup FFmpeg paths
         self.script_dir = Path(__file__).parent
@@ -51,18 +244,12 @@ class VideoFrameExtractor:
         self._create_output_directory()
 
     def _setup_ffmpeg_paths(self) -> None:
-        """Setup FFmpeg binary paths and environment."""
-        if self.ffmpeg_dir.exists():
-            # Add local ffmpeg to PATH
-            ffmpeg_path = str(self.ffmpeg_dir)
-            current_path = os.environ.get("PATH", "")
-            os.environ["PATH"] = ffmpeg_path + os.pathsep + current_path
-            self.ffmpeg_bin = str(self.ffmpeg_dir / "ffmpeg.exe")
-            self.ffprobe_bin = str(self.ffmpeg_dir / "ffprobe.exe")
-        else:
-            # Fallback to system FFmpeg
-            self.ffmpeg_bin = "ffmpeg"
-            self.ffprobe_bin = "ffprobe"
+        """Setup FFmpeg binary paths.
+
+        No PATH mutation: the resolved paths are absolute, so every
+        subprocess call finds the binaries without touching the environment.
+        """
+        self.ffmpeg_bin, self.ffprobe_bin = _resolve_binaries()
 
     def _validate_inputs(self) -> None:
         """Validate input video file exists and is readable."""
@@ -72,67 +259,65 @@ class VideoFrameExtractor:
         if not self.video_path.is_file():
             raise ValueError(f"Input path is not a file: {self.video_path}")
 
-        # Check if FFmpeg is installed
-        try:
-            subprocess.run(
-                [self.ffmpeg_bin, "-version"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True,
-            )
-        except FileNotFoundError:
-            raise RuntimeError(
-                "FFmpeg is not installed or not in PATH. Please install FFmpeg or ensure ffmpeg folder exists."
-            )
-        except subprocess.CalledProcessError:
-            raise RuntimeError("FFmpeg check failed.")
+        # Check if FFmpeg is installed (cached per binary for the process)
+        _ensure_ffmpeg(self.ffmpeg_bin)
 
     def _create_output_directory(self) -> None:
         """Create output directory if it doesn't exist."""
         self.output_dir.mkdir(parents=True, exist_ok=True)
         print(f"Output directory: {self.output_dir.absolute()}")
 
-    def _get_video_info(self) -> dict:
-        """Get video information (duration, fps, resolution)."""
-        try:
-            result = subprocess.run(
-                [
-                    self.ffprobe_bin,
-                    "-v",
-                    "error",
-                    "-select_streams",
-                    "v:0",
-                    "-show_entries",
-                    "stream=duration,r_frame_rate,width,height",
-                    "-of",
-                    "default=noprint_wrappers=1:nokey=1:noprint_section_header=1",
-                    str(self.video_path),
-                ],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                text=True,
-                check=True,
-            )
+    def _resolve_stage_dir(self) -> Optional[Path]:
+        """Create and return a unique staging directory, or None if disabled."""
+        if not self.stage_dir:
+            return None
 
-            lines = result.stdout.strip().split("\n")
-            if len(lines) >= 4:
-                duration = float(lines[0]) if lines[0] else 0
-                fps_str = lines[1]
-                # Parse fps like "30/1" or "29.97"
-                fps = eval(fps_str) if "/" in fps_str else float(fps_str)
-                width = int(lines[2]) if lines[2] else 0
-                height = int(lines[3]) if lines[3] else 0
-
-                return {
-                    "duration": duration,
-                    "fps": fps,
-                    "width": width,
-                    "height": height,
-                }
-        except (subprocess.CalledProcessError, ValueError, IndexError):
-            print("Warning: Could not retrieve video information")
+        if self.stage_dir == "auto":
+            # Prefer tmpfs so staged writes never hit the disk
+            shm = Path("/dev/shm")
+            base = shm if shm.is_dir() else Path(tempfile.gettempdir())
+        else:
+            base = Path(self.stage_dir).expanduser().resolve()
 
-        return {"duration": 0, "fps": 0, "width": 0, "height": 0}
+        stage = base / f"frames_{uuid.uuid4().hex}"
+        stage.mkdir(parents=True, exist_ok=True)
+        return stage
+
+    def _promote_staged_frames(self, stage: Path) -> bool:
+        """
+        Bulk-move staged frames into the output directory.
+
+        Returns:
+            True if every frame moved successfully
+        """
+        names = os.listdir(stage)
+        # shutil.move falls back to copy+unlink when the staging dir is on a
+        # different filesystem (the usual case for /dev/shm)
+        with ThreadPoolExecutor(
+            max_workers=min(8, os.cpu_count() or 1)
+        ) as move_pool:
+            futures = [
+                move_pool.submit(
+                    shutil.move, str(stage / name), str(self.output_dir / name)
+                )
+                for name in names
+            ]
+
+        success = True
+        for future in futures:
+            try:
+                future.result()
+            except (OSError, shutil.Error) as e:
+                print(f"Error moving staged frame: {e}")
+                success = False
+
+        return success
+
+    def _get_video_info(self) -> dict:
+        """Get video information (duration, fps, resolution)."""
+        if self.video_info is None:
+            self.video_info = _probe_video_info(self.ffprobe_bin, self.video_path)
+        return self.video_info
 
     def extract_frames(self, verbose: bool = True) -> bool:
         """
@@ -144,51 +329,261 @@ class VideoFrameExtractor:
         Returns:
             True if successful, False otherwise
         """
-        # Get video info
-        video_info = self._get_video_info()
+        # Launch the metadata probe but don't wait for it yet: ffmpeg doesn't
+        # need the probe output to start decoding, so both can spin up
+        # concurrently. Skipped in quiet mode (unless pre-probed) since the
+        # metadata is only used for status output.
+        probe = None
+        if verbose and self.video_info is None:
+            try:
+                probe = _start_probe(self.ffprobe_bin, self.video_path)
+            except FileNotFoundError:
+                pass
 
         if verbose:
             print(f"Processing video: {self.video_path.name}")
-            if video_info["duration"]:
-                print(f"Duration: {video_info['duration']:.2f}s")
-                print(f"FPS: {video_info['fps']:.2f}")
-                print(f"Resolution: {video_info['width']}x{video_info['height']}")
-            print(f"Extracting frames at {self.frame_rate} fps as .{self.format}...")
 
-        # Output pattern for frames
-        output_pattern = str(self.output_dir / f"frame_%06d.{self.format}")
+        # Output pattern for frames (staged first when a stage dir is set)
+        stage = self._resolve_stage_dir()
+        frame_dir = stage if stage is not None else self.output_dir
+        output_pattern = str(frame_dir / f"frame_%06d.{self.format}")
 
         # Build FFmpeg command
         # -vf fps=X sets the frame extraction rate
         # -start_number 0 starts frame numbering at 0
-        cmd = [
-            self.ffmpeg_bin,
+        # -progress pipe:1 emits a clean key=value progress stream on stdout;
+        # -nostats silences the rolling status line on stderr
+        cmd = [self.ffmpeg_bin, *FFMPEG_BASE, "-progress", "pipe:1", "-nostats"]
+        if self.hwaccel:
+            # Hardware decode must be requested before the input. No
+            # -hwaccel_output_format: the fps filter and software image
+            # encoders need frames downloaded back to system memory, which
+            # plain -hwaccel does automatically.
+            cmd += ["-hwaccel", self.hwaccel]
+        if self.ffmpeg_threads is not None:
+            # Before -i so it caps the decoder's thread pool, not just the
+            # encoder (which defaults to one thread per core otherwise)
+            cmd += ["-threads", str(self.ffmpeg_threads)]
+        cmd += [
             "-i",
             str(self.video_path),
             "-vf",
             f"fps={self.frame_rate}",
             "-start_number",
             "0",
-            output_pattern,
         ]
+        if self.format == "png":
+            # Fastest zlib level; still lossless, but 3-5x cheaper to encode
+            cmd += ["-compression_level", "1"]
+        elif self.format in ("jpg", "jpeg"):
+            cmd += ["-qscale:v", "2", "-vsync", "0"]
+        if self.ffmpeg_threads is not None:
+            cmd += ["-threads", str(self.ffmpeg_threads)]
+        cmd.append(output_pattern)
+
+        keep_stage = False
 
         try:
-            # Run FFmpeg with progress
+            # Run FFmpeg with progress. stdout stays a pipe only because it
+            # carries the -progress stream, drained by a thread below; every
+            # pipe nobody reads would risk blocking ffmpeg once the kernel
+            # buffer fills.
             process = subprocess.Popen(
-                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE
+            )
+
+            # Collect the probe while ffmpeg is already decoding
+            if probe is not None:
+                self.video_info = _finish_probe(probe)
+            video_info = self.video_info
+
+            if verbose:
+                if video_info and video_info["duration"]:
+                    print(f"Duration: {video_info['duration']:.2f}s")
+                    print(f"FPS: {video_info['fps']:.2f}")
+                    print(f"Resolution: {video_info['width']}x{video_info['height']}")
+                print(
+                    f"Extracting frames at {self.frame_rate} fps as .{self.format}..."
+                )
+
+            # Track the frame counter from the stdout progress stream in a
+            # side thread while the main thread drains stderr
+            progress_frames = [0]
+
+            def _drain_progress(stream) -> None:
+                for line in stream:
+                    match = FFMPEG_PROGRESS_RE.search(line)
+                    if match:
+                        progress_frames[0] = int(match.group(1))
+                stream.close()
+
+            progress_thread = threading.Thread(
+                target=_drain_progress, args=(process.stdout,), daemon=True
             )
+            progress_thread.start()
+
+            # Drain stderr incrementally instead of buffering the whole
+            # stream in communicate(); keep only the tail for error reporting
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+            for line in process.stderr:
+                stderr_tail.append(line)
+            process.stderr.close()
 
-            # Read stderr for progress information
-            _, stderr = process.communicate()
+            process.wait()
+            progress_thread.join()
 
             if process.returncode != 0:
+                stderr = b"".join(stderr_tail).decode(errors="replace")
+                print(f"FFmpeg error: {stderr}")
+                return False
+
+            if stage is not None and not self._promote_staged_frames(stage):
+                # Never destroy frames that didn't make it to the output dir
+                # (e.g. the destination disk filled mid-move)
+                keep_stage = True
+                print(f"Error: Could not move all staged frames; left in: {stage}")
+                return False
+
+            # ffmpeg already reported the frame count on its progress stream;
+            # estimate from duration * fps if the stream didn't yield one.
+            # Either way, no post-hoc directory scan is needed.
+            extracted_frames = progress_frames[0]
+            if not extracted_frames and video_info and video_info["duration"]:
+                try:
+                    extracted_frames = int(
+                        round(video_info["duration"] * float(self.frame_rate))
+                    )
+                except ValueError:
+                    pass  # frame_rate like "fps=source" isn't a number
+
+            if not extracted_frames:
+                # Last resort: count the files. os.listdir returns raw names
+                # from a single getdents pass and the suffix test is a plain
+                # string check - no fnmatch machinery, no Path allocation.
+                suffix = f".{self.format}"
+                extracted_frames = sum(
+                    1
+                    for name in os.listdir(self.output_dir)
+                    if name.endswith(suffix)
+                )
+
+            if verbose:
+                print(f"\n✓ Successfully extracted {extracted_frames} frames")
+                print(f"Frames saved to: {self.output_dir.absolute()}")
+
+            return True
+
+        except Exception as e:
+            print(f"Error during frame extraction: {e}")
+            return False
+
+        finally:
+            if stage is not None and not keep_stage:
+                shutil.rmtree(stage, ignore_errors=True)
+
+    def extract_frames_segmented(self, segments: int, verbose: bool = True) -> bool:
+        """
+        Extract frames by splitting the timeline into parallel segments.
+
+        Each segment runs its own ffmpeg with -ss/-to (placed before the
+        input for fast keyframe seeking) and a disjoint -start_number offset,
+        so all segments write non-overlapping frame numbers into the same
+        output directory and the CPU-bound encode spreads across cores.
+        Falls back to a single pass for short videos, a single segment, or a
+        non-numeric frame rate (offsets can't be computed for 'fps=source').
+
+        Args:
+            segments: Number of concurrent ffmpeg segments
+            verbose: Print progress information
+
+        Returns:
+            True if successful, False otherwise
+        """
+        video_info = self._get_video_info()
+        duration = video_info["duration"]
+
+        try:
+            rate = float(self.frame_rate)
+        except ValueError:
+            rate = 0.0
+
+        if (
+            segments <= 1
+            or not rate
+            or not duration
+            or duration < MIN_SEGMENT_DURATION
+        ):
+            return self.extract_frames(verbose=verbose)
+
+        if verbose:
+            print(f"Processing video: {self.video_path.name}")
+            print(
+                f"Extracting frames at {self.frame_rate} fps as .{self.format} "
+                f"in {segments} parallel segments..."
+            )
+
+        seg_len = duration / segments
+
+        # Segments are staged first when a stage dir is set, same as
+        # extract_frames
+        stage = self._resolve_stage_dir()
+        frame_dir = stage if stage is not None else self.output_dir
+        output_pattern = str(frame_dir / f"frame_%06d.{self.format}")
+        keep_stage = False
+
+        def _run_segment(index: int) -> subprocess.CompletedProcess:
+            start = index * seg_len
+            end = duration if index == segments - 1 else (index + 1) * seg_len
+
+            cmd = [self.ffmpeg_bin, *FFMPEG_BASE]
+            if self.hwaccel:
+                cmd += ["-hwaccel", self.hwaccel]
+            cmd += [
+                "-ss",
+                f"{start:.6f}",
+                "-to",
+                f"{end:.6f}",
+                "-i",
+                str(self.video_path),
+                "-vf",
+                f"fps={self.frame_rate}",
+                "-start_number",
+                str(int(round(start * rate))),
+            ]
+            if self.format == "png":
+                cmd += ["-compression_level", "1"]
+            elif self.format in ("jpg", "jpeg"):
+                cmd += ["-qscale:v", "2", "-vsync", "0"]
+            cmd.append(output_pattern)
+
+            return subprocess.run(
+                cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE
+            )
+
+        try:
+            # Threads are enough here - each one just waits on its ffmpeg
+            with ThreadPoolExecutor(max_workers=segments) as pool:
+                results = list(pool.map(_run_segment, range(segments)))
+
+            failed = [r for r in results if r.returncode != 0]
+            if failed:
+                stderr = failed[0].stderr.decode(errors="replace")
                 print(f"FFmpeg error: {stderr}")
                 return False
 
-            # Count extracted frames
-            extracted_frames = len(list(self.output_dir.glob(f"frame_*.{self.format}")))
+            if stage is not None and not self._promote_staged_frames(stage):
+                # Never destroy frames that didn't make it to the output dir
+                keep_stage = True
+                print(f"Error: Could not move all staged frames; left in: {stage}")
+                return False
 
             if verbose:
+                suffix = f".{self.format}"
+                extracted_frames = sum(
+                    1
+                    for name in os.listdir(self.output_dir)
+                    if name.endswith(suffix)
+                )
                 print(f"\n✓ Successfully extracted {extracted_frames} frames")
                 print(f"Frames saved to: {self.output_dir.absolute()}")
 
@@ -198,10 +593,308 @@ class VideoFrameExtractor:
             print(f"Error during frame extraction: {e}")
             return False
 
+        finally:
+            if stage is not None and not keep_stage:
+                shutil.rmtree(stage, ignore_errors=True)
+
+    def extract_frames_stream(self, callback=None, verbose: bool = True) -> bool:
+        """
+        Stream frames from the video as in-memory JPEGs without per-frame files.
+
+        FFmpeg pipes an MJPEG stream to stdout; each frame is sliced out of the
+        stream by scanning for the JPEG SOI/EOI markers. This avoids one file
+        write (and its filesystem overhead) per frame, which matters for
+        high-fps extraction or when frames are consumed programmatically.
+
+        Args:
+            callback: Called as callback(index, jpeg_bytes) for each frame.
+                When None, frames are written to the output directory as
+                frame_%06d.jpg instead.
+            verbose: Print progress information
+
+        Returns:
+            True if successful, False otherwise
+        """
+        if callback is None:
+
+            def callback(idx: int, jpeg_bytes: bytes) -> None:
+                (self.output_dir / f"frame_{idx:06d}.jpg").write_bytes(jpeg_bytes)
+
+        if verbose:
+            print(f"Processing video: {self.video_path.name}")
+            print(f"Streaming frames at {self.frame_rate} fps as MJPEG...")
+
+        # Build FFmpeg command
+        # -f image2pipe with -vcodec mjpeg emits back-to-back JPEGs on stdout
+        cmd = [
+            self.ffmpeg_bin,
+            *FFMPEG_BASE,
+            "-i",
+            str(self.video_path),
+            "-vf",
+            f"fps={self.frame_rate}",
+            "-f",
+            "image2pipe",
+            "-vcodec",
+            "mjpeg",
+            "-qscale:v",
+            "2",
+            "-",
+        ]
+
+        try:
+            process = subprocess.Popen(
+                cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+                bufsize=1 << 20,
+            )
+
+            # Drain stderr in a side thread while the main loop reads stdout;
+            # a blocked, unread stderr pipe would deadlock ffmpeg once the
+            # kernel buffer fills (same fix as extract_frames)
+            stderr_tail = deque(maxlen=STDERR_TAIL_LINES)
+
+            def _drain_stderr(stream) -> None:
+                for line in stream:
+                    stderr_tail.append(line)
+                stream.close()
+
+            stderr_thread = threading.Thread(
+                target=_drain_stderr, args=(process.stderr,), daemon=True
+            )
+            stderr_thread.start()
+
+            buffer = bytearray()
+            frame_index = 0
+
+            while True:
+                chunk = process.stdout.read(1 << 20)
+                if not chunk:
+                    break
+                buffer.extend(chunk)
+
+                # Slice out every complete JPEG currently in the buffer
+                while True:
+                    start = buffer.find(b"\xff\xd8")
+                    if start < 0:
+                        break
+                    end = buffer.find(b"\xff\xd9", start + 2)
+                    if end < 0:
+                        break
+                    callback(frame_index, bytes(buffer[start : end + 2]))
+                    frame_index += 1
+                    del buffer[: end + 2]
+
+            process.stdout.close()
+            stderr_thread.join()
+
+            if process.wait() != 0:
+                stderr = b"".join(stderr_tail).decode(errors="replace")
+                print(f"FFmpeg error: {stderr}")
+                return False
+
+            if verbose:
+                print(f"\n✓ Successfully streamed {frame_index} frames")
+
+            return True
+
+        except Exception as e:
+            print(f"Error during frame streaming: {e}")
+            return False
+
+    def process_video(self, callback, prefetch: int = 8, verbose: bool = True) -> bool:
+        """
+        Run a decode -> callback -> encode pipeline over the video.
+
+        One ffmpeg decodes raw BGR24 frames to a pipe; a reader thread pushes
+        them into a bounded queue; the calling thread invokes
+        callback(index, frame_bytes, width, height) for each frame; a writer
+        thread feeds the (possibly modified) bytes into a second ffmpeg that
+        encodes them as images in the output directory. The bounded queues let
+        decode of frame N+1 overlap processing of N and encoding of N-1,
+        while the callback itself stays single-threaded so user state is safe.
+
+        Args:
+            callback: Per-frame hook; may return replacement frame bytes of
+                the same size, or None to keep the frame unchanged
+            prefetch: Maximum frames buffered between pipeline stages
+            verbose: Print progress information
+
+        Returns:
+            True if successful, False otherwise
+        """
+        video_info = self._get_video_info()
+        width, height = video_info["width"], video_info["height"]
+
+        if not width or not height:
+            print("Error: Could not determine video resolution for processing")
+            return False
+
+        frame_size = width * height * 3
+
+        if verbose:
+            print(f"Processing video: {self.video_path.name}")
+            print(f"Pipeline: decode -> callback -> encode at {width}x{height}")
+
+        decode_cmd = [
+            self.ffmpeg_bin,
+            *FFMPEG_BASE,
+            "-i",
+            str(self.video_path),
+            "-vf",
+            f"fps={self.frame_rate}",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-",
+        ]
+
+        output_pattern = str(self.output_dir / f"frame_%06d.{self.format}")
+        # No -nostdin here: the encoder reads its input from stdin
+        encode_cmd = [
+            self.ffmpeg_bin,
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-y",
+            "-f",
+            "rawvideo",
+            "-pix_fmt",
+            "bgr24",
+            "-s",
+            f"{width}x{height}",
+            "-i",
+            "-",
+            "-start_number",
+            "0",
+            output_pattern,
+        ]
+
+        try:
+            decoder = subprocess.Popen(
+                decode_cmd,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                bufsize=frame_size * 2,
+            )
+            encoder = subprocess.Popen(
+                encode_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+
+            read_q = queue.Queue(maxsize=prefetch)
+            write_q = queue.Queue(maxsize=prefetch)
+
+            def _reader() -> None:
+                idx = 0
+                try:
+                    while True:
+                        data = decoder.stdout.read(frame_size)
+                        # Top up short reads until a whole frame is buffered
+                        while 0 < len(data) < frame_size:
+                            more = decoder.stdout.read(frame_size - len(data))
+                            if not more:
+                                break
+                            data += more
+                        if len(data) < frame_size:
+                            break
+                        read_q.put((idx, data))
+                        idx += 1
+                finally:
+                    # EOF sentinel, even if the read itself raised, so the
+                    # consumer can never hang waiting for it
+                    read_q.put(None)
+
+            # Filled by the writer if the encoder dies mid-stream (bad output
+            # path, unsupported format, disk full); the producer loop checks
+            # it so the pipeline winds down instead of blocking forever on a
+            # full queue
+            write_error = [None]
+
+            def _writer() -> None:
+                while True:
+                    item = write_q.get()
+                    if item is None:
+                        break
+                    if write_error[0] is not None:
+                        continue  # keep draining so the producer never blocks
+                    try:
+                        encoder.stdin.write(item)
+                    except OSError as e:
+                        write_error[0] = e
+                try:
+                    encoder.stdin.close()
+                except OSError:
+                    pass
+
+            reader = threading.Thread(target=_reader, daemon=True)
+            writer = threading.Thread(target=_writer, daemon=True)
+            reader.start()
+            writer.start()
+
+            frame_count = 0
+            eof_seen = False
+            try:
+                while True:
+                    item = read_q.get()
+                    if item is None:
+                        eof_seen = True
+                        break
+                    if write_error[0] is not None:
+                        # Run already failed: stop decoding, but keep draining
+                        # read_q so the reader thread can reach EOF
+                        decoder.terminate()
+                        continue
+                    idx, data = item
+                    result = callback(idx, data, width, height)
+                    write_q.put(result if result is not None else data)
+                    frame_count += 1
+            finally:
+                # Wind the whole pipeline down even if the callback raised:
+                # otherwise both ffmpegs and both threads leak, parked on
+                # full pipes and queues
+                if not eof_seen:
+                    decoder.terminate()
+                    while read_q.get() is not None:
+                        pass
+                write_q.put(None)
+                reader.join()
+                writer.join()
+
+                decoder.stdout.close()
+                decoder.wait()
+                encoder.wait()
+
+            if write_error[0] is not None:
+                print(f"FFmpeg error during video processing: {write_error[0]}")
+                return False
+
+            if decoder.returncode != 0 or encoder.returncode != 0:
+                print("FFmpeg error during video processing")
+                return False
+
+            if verbose:
+                print(f"\n✓ Successfully processed {frame_count} frames")
+                print(f"Frames saved to: {self.output_dir.absolute()}")
+
+            return True
+
+        except Exception as e:
+            print(f"Error during video processing: {e}")
+            return False
+
 
 def find_video_files(folder_path: Path) -> list:
     """
-    Find all video files in a folder.
+    Find all video files in a folder (recursively).
+
+    Uses os.scandir instead of Path.rglob so directory/file checks come from
+    the cached readdir type info (no extra stat per entry) and Path objects
+    are only built for actual matches.
 
     Args:
         folder_path: Path to the folder to search
@@ -209,39 +902,167 @@ def find_video_files(folder_path: Path) -> list:
     Returns:
         List of video file paths
     """
-    video_extensions = {
-        ".mp4",
-        ".mov",
-        ".avi",
-        ".mkv",
-        ".webm",
-        ".flv",
-        ".wmv",
-        ".m4v",
-        ".mpg",
-        ".mpeg",
-        ".3gp",
-        ".m2ts",
-        ".mts",
-        ".ts",
-        ".vob",
-        ".f4v",
-        ".asf",
-        ".rm",
-        ".rmvb",
-        ".ogv",
-        ".mxf",
-        ".gif",
-    }
-
     video_files = []
-    for file in folder_path.rglob("*"):
-        if file.is_file() and file.suffix.lower() in video_extensions:
-            video_files.append(file)
+    stack = [str(folder_path)]
+
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                        continue
+                    # Check the cheap extension test before is_file()
+                    _, dot, ext = entry.name.rpartition(".")
+                    if dot and ext.lower() in VIDEO_EXTENSIONS and entry.is_file():
+                        video_files.append(Path(entry.path))
+        except OSError:
+            continue
 
     return sorted(video_files)
 
 
+def _process_one(
+    video_file: Path,
+    output_base: Path,
+    fps: Optional[str],
+    fmt: str,
+    quiet: bool,
+    ffmpeg_threads: Optional[int] = None,
+    video_info: Optional[dict] = None,
+    hwaccel: Optional[str] = None,
+    stage_dir: Optional[str] = None,
+) -> tuple:
+    """
+    Extract frames from a single video into its own subdirectory.
+
+    Top-level so it can be pickled and submitted to a ProcessPoolExecutor.
+
+    Returns:
+        Tuple of (video file name, success flag)
+    """
+    # Create subdirectory for each video using video filename (without extension)
+    video_output_dir = output_base / video_file.stem
+
+    try:
+        extractor = VideoFrameExtractor(
+            video_path=str(video_file),
+            output_dir=str(video_output_dir),
+            frame_rate=fps,
+            format=fmt,
+            ffmpeg_threads=ffmpeg_threads,
+            video_info=video_info,
+            hwaccel=hwaccel,
+            stage_dir=stage_dir,
+        )
+
+        success = extractor.extract_frames(verbose=not quiet)
+
+    except (FileNotFoundError, ValueError, RuntimeError) as e:
+        print(f"Error processing {video_file.name}: {e}", file=sys.stderr)
+        success = False
+
+    return video_file.name, success
+
+
+def _extract_batch(
+    video_files: list,
+    output_base: Path,
+    fps: Optional[str],
+    fmt: str,
+    hwaccel: Optional[str] = None,
+    quiet: bool = False,
+) -> list:
+    """
+    Extract frames from many videos through one ffmpeg process per chunk.
+
+    Instead of spawning one ffmpeg per video, each chunk of inputs is given to
+    a single ffmpeg invocation with per-input -map/output groups, so the
+    process (and its DLL/libc setup cost) is paid once per BATCH_CHUNK_SIZE
+    videos rather than once per video. Most useful on platforms where process
+    creation is expensive (e.g. Windows).
+
+    Args:
+        video_files: Video paths to process
+        output_base: Base output directory (one subdirectory per video)
+        fps: Frame extraction rate (default: 30)
+        fmt: Output image format
+        hwaccel: Optional hardware decode acceleration
+        quiet: Suppress verbose output
+
+    Returns:
+        List of video file names that failed to process
+    """
+    ffmpeg_bin, _ = _resolve_binaries()
+    _ensure_ffmpeg(ffmpeg_bin)
+
+    frame_rate = fps or "30"
+    fmt = _normalize_format(fmt)
+
+    failed_videos = []
+
+    for chunk_start in range(0, len(video_files), BATCH_CHUNK_SIZE):
+        chunk = video_files[chunk_start : chunk_start + BATCH_CHUNK_SIZE]
+
+        cmd = [ffmpeg_bin, *FFMPEG_BASE]
+        for video_file in chunk:
+            if hwaccel:
+                cmd += ["-hwaccel", hwaccel]
+            cmd += ["-i", str(video_file)]
+
+        for input_index, video_file in enumerate(chunk):
+            video_output_dir = output_base / video_file.stem
+            video_output_dir.mkdir(parents=True, exist_ok=True)
+
+            cmd += [
+                "-map",
+                f"{input_index}:v",
+                "-vf",
+                f"fps={frame_rate}",
+                "-start_number",
+                "0",
+            ]
+            if fmt == "png":
+                cmd += ["-compression_level", "1"]
+            elif fmt in ("jpg", "jpeg"):
+                cmd += ["-qscale:v", "2", "-vsync", "0"]
+            cmd.append(str(video_output_dir / f"frame_%06d.{fmt}"))
+
+        if not quiet:
+            first, last = chunk_start + 1, chunk_start + len(chunk)
+            print(f"\nProcessing videos {first}-{last} of {len(video_files)}...")
+
+        result = subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+        )
+
+        if result.returncode != 0:
+            # ffmpeg aborts the whole invocation, so the failure can't be
+            # attributed to a single input
+            stderr = result.stderr.decode(errors="replace")
+            print(f"FFmpeg error: {stderr}", file=sys.stderr)
+            failed_videos.extend(video_file.name for video_file in chunk)
+
+    return failed_videos
+
+
+def _report_batch_summary(
+    args, video_files: list, failed_videos: list, output_base: Path
+) -> None:
+    """Print the end-of-batch summary unless running in quiet mode."""
+    if args.quiet:
+        return
+    successful = len(video_files) - len(failed_videos)
+    print(f"\n{'=' * 50}")
+    print(f"Batch processing complete!")
+    print(f"Successfully processed: {successful}/{len(video_files)} videos")
+    if failed_videos:
+        print(f"Failed videos: {', '.join(failed_videos)}")
+    print(f"Output directory: {output_base.absolute()}")
+
+
 def main():
     """Main entry point."""
     parser = argparse.ArgumentParser(
@@ -278,7 +1099,58 @@ Folder input (processes all videos):
         "--format",
         type=str,
         default="png",
-        help="Output image format (png, jpg, bmp, webp, etc. - default: png)",
+        help="Output image format (png, jpg, bmp, webp, etc. - default: png). "
+        "png is lossless but slowest to encode; jpg is much faster and smaller "
+        "at near-visually-lossless quality",
+    )
+
+    parser.add_argument(
+        "--hwaccel",
+        type=str,
+        default=None,
+        help="Hardware decode acceleration passed to FFmpeg (e.g. 'cuda' for "
+        "NVIDIA GPUs; default: software decode)",
+    )
+
+    # --jobs and --batch-ffmpeg are competing folder-mode strategies
+    folder_mode = parser.add_mutually_exclusive_group()
+
+    folder_mode.add_argument(
+        "--jobs",
+        type=int,
+        default=None,
+        help="Number of videos to process in parallel when the input is a folder "
+        "(default: one worker per video, capped at the CPU count)",
+    )
+
+    parser.add_argument(
+        "--segments",
+        type=int,
+        default=1,
+        help="Split a single long video into this many segments extracted by "
+        "concurrent ffmpeg processes (ignored for folder inputs and videos "
+        f"shorter than {MIN_SEGMENT_DURATION:.0f}s; default: 1)",
+    )
+
+    parser.add_argument(
+        "--stage-dir",
+        type=str,
+        nargs="?",
+        const="auto",
+        default=None,
+        help="Stage frames in this directory and bulk-move them into the "
+        "output directory when extraction finishes; pass the flag without a "
+        "value to auto-pick /dev/shm (or the system temp dir). Not used in "
+        "--batch-ffmpeg mode",
+    )
+
+    folder_mode.add_argument(
+        "--batch-ffmpeg",
+        action="store_true",
+        help="Process folder inputs through one ffmpeg invocation per chunk "
+        f"of {BATCH_CHUNK_SIZE} videos instead of one process per video "
+        "(amortizes process spawn cost; mutually exclusive with --jobs, and "
+        "--stage-dir does not apply)",
     )
 
     parser.add_argument(
@@ -303,43 +1175,92 @@ Folder input (processes all videos):
             if not args.quiet:
                 print(f"Found {len(video_files)} video file(s) in {input_path.name}/")
 
-            failed_videos = []
+            # Fail fast on a missing FFmpeg before spawning any workers
+            ffmpeg_bin, ffprobe_bin = _resolve_binaries()
+            _ensure_ffmpeg(ffmpeg_bin)
 
-            for idx, video_file in enumerate(video_files, 1):
-                if not args.quiet:
-                    print(f"\n[{idx}/{len(video_files)}] Processing: {video_file.name}")
+            if args.batch_ffmpeg:
+                failed_videos = _extract_batch(
+                    video_files,
+                    output_base,
+                    args.fps,
+                    args.format,
+                    hwaccel=args.hwaccel,
+                    quiet=args.quiet,
+                )
+                _report_batch_summary(args, video_files, failed_videos, output_base)
+                sys.exit(0 if not failed_videos else 1)
 
-                # Create subdirectory for each video using video filename (without extension)
-                video_name = video_file.stem
-                video_output_dir = output_base / video_name
+            # Pre-probe all videos with one concurrent ffprobe pass instead of
+            # a serial spawn per video; skipped in quiet mode where the
+            # metadata would never be printed anyway
+            video_infos = {}
+            if not args.quiet:
+                with ThreadPoolExecutor(
+                    max_workers=min(len(video_files), os.cpu_count() or 1)
+                ) as probe_pool:
+                    probe_futures = {
+                        probe_pool.submit(
+                            _probe_video_info, ffprobe_bin, video_file
+                        ): video_file
+                        for video_file in video_files
+                    }
+                    for future in as_completed(probe_futures):
+                        video_infos[probe_futures[future]] = future.result()
 
-                try:
-                    extractor = VideoFrameExtractor(
-                        video_path=str(video_file),
-                        output_dir=str(video_output_dir),
-                        frame_rate=args.fps,
-                        format=args.format,
-                    )
+            failed_videos = []
 
-                    success = extractor.extract_frames(verbose=not args.quiet)
+            jobs = args.jobs or min(len(video_files), os.cpu_count() or 1)
 
-                    if not success:
-                        failed_videos.append(video_file.name)
+            if jobs > 1:
+                # Run one ffmpeg per video in parallel worker processes.
+                # Cap each ffmpeg at a single thread so the pool doesn't
+                # oversubscribe the CPU.
+                with ProcessPoolExecutor(max_workers=jobs) as pool:
+                    futures = {
+                        pool.submit(
+                            _process_one,
+                            video_file,
+                            output_base,
+                            args.fps,
+                            args.format,
+                            args.quiet,
+                            1,
+                            video_infos.get(video_file),
+                            args.hwaccel,
+                            args.stage_dir,
+                        ): video_file
+                        for video_file in video_files
+                    }
 
-                except (FileNotFoundError, ValueError, RuntimeError) as e:
-                    print(f"Error processing {video_file.name}: {e}", file=sys.stderr)
-                    failed_videos.append(video_file.name)
+                    for idx, future in enumerate(as_completed(futures), 1):
+                        name, success = future.result()
+                        if not args.quiet:
+                            print(f"\n[{idx}/{len(video_files)}] Finished: {name}")
+                        if not success:
+                            failed_videos.append(name)
+            else:
+                for idx, video_file in enumerate(video_files, 1):
+                    if not args.quiet:
+                        print(
+                            f"\n[{idx}/{len(video_files)}] Processing: {video_file.name}"
+                        )
 
-            # Summary
-            if not args.quiet:
-                successful = len(video_files) - len(failed_videos)
-                print(f"\n{'=' * 50}")
-                print(f"Batch processing complete!")
-                print(f"Successfully processed: {successful}/{len(video_files)} videos")
-                if failed_videos:
-                    print(f"Failed videos: {', '.join(failed_videos)}")
-                print(f"Output directory: {output_base.absolute()}")
+                    name, success = _process_one(
+                        video_file,
+                        output_base,
+                        args.fps,
+                        args.format,
+                        args.quiet,
+                        video_info=video_infos.get(video_file),
+                        hwaccel=args.hwaccel,
+                        stage_dir=args.stage_dir,
+                    )
+
+                    if not success:
+                        failed_videos.append(name)
 
+            _report_batch_summary(args, video_files, failed_videos, output_base)
             sys.exit(0 if not failed_videos else 1)
 
         elif input_path.is_file():
@@ -349,9 +1270,16 @@ Folder input (processes all videos):
                 output_dir=args.output,
                 frame_rate=args.fps,
                 format=args.format,
+                hwaccel=args.hwaccel,
+                stage_dir=args.stage_dir,
             )
 
-            success = extractor.extract_frames(verbose=not args.quiet)
+            if args.segments > 1:
+                success = extractor.extract_frames_segmented(
+                    args.segments, verbose=not args.quiet
+                )
+            else:
+                success = extractor.extract_frames(verbose=not args.quiet)
 
             sys.exit(0 if success else 1)
 